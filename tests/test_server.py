@@ -1,46 +1,48 @@
 import pytest
-from chroma_mcp.server import get_chroma_client, create_parser, mcp
+import contextlib
+import functools
+from chroma_mcp.server import get_chroma_client, create_parser, main, mcp
+from chroma_mcp.server import chroma_add_documents as _add_docs
 import chromadb
 import sys
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 import argparse
 from mcp.server.fastmcp.exceptions import ToolError # Import ToolError
 import json # Import json for parsing results
 import pytest_asyncio # Import pytest_asyncio for async fixtures
+import uuid
 
 
-# Add pytest-asyncio marker
-pytest_plugins = ['pytest_asyncio']
-
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_args():
-    # Modify sys.argv to provide the required arguments for all tests
-    original_argv = sys.argv.copy()
-    sys.argv = ['chroma-mcp', '--client-type', 'ephemeral']
-    yield
-    sys.argv = original_argv
-
-@pytest.fixture
-def mock_env_vars():
-    """Fixture to mock environment variables and clean them up after tests."""
-    original_environ = os.environ.copy()
-    yield
-    os.environ.clear()
-    os.environ.update(original_environ)
+    # Provide the required arguments once for the whole run; tests that need
+    # different arguments patch sys.argv locally with monkeypatch
+    sys.argv[:] = ['chroma-mcp', '--client-type', 'ephemeral']
+
+@pytest.fixture(scope="session")
+def chroma_client(setup_test_args):
+    """Session-wide handle to the ephemeral Chroma client used by the server tools."""
+    return get_chroma_client()
+
+# Built once per process; tests that depend on env vars at construction time call create_parser()
+_cached_parser = functools.lru_cache(maxsize=1)(create_parser)
+
+@pytest.fixture(scope="module")
+def parser():
+    """Argument parser shared by the parsing tests that don't depend on env vars."""
+    return _cached_parser()
 
 def test_get_chroma_client_ephemeral():
     # Test ephemeral client creation
     client = get_chroma_client()
     assert isinstance(client, chromadb.ClientAPI)
 
-@pytest.mark.asyncio
 async def test_list_collections():
     # Test list_collections tool
     result = await mcp.call_tool("chroma_list_collections", {"limit": None, "offset": None})
     assert isinstance(result, list)
 
-@pytest.mark.asyncio
 async def test_create_and_delete_collection():
     # Test collection creation and deletion
     collection_name = "test_collection"
@@ -57,9 +59,8 @@ async def test_create_and_delete_collection():
 
 # New tests for argument parsing
 
-def test_create_parser_defaults():
+def test_create_parser_defaults(parser):
     """Test that the parser creates default values correctly."""
-    parser = create_parser()
     args = parser.parse_args(['--client-type', 'ephemeral'])
     
     # Check default values
@@ -67,9 +68,8 @@ def test_create_parser_defaults():
     assert args.ssl is True  # Default should be True
     assert args.dotenv_path == '.chroma_env'
 
-def test_create_parser_all_args():
+def test_create_parser_all_args(parser):
     """Test that the parser handles all arguments correctly."""
-    parser = create_parser()
     args = parser.parse_args([
         '--client-type', 'http',
         '--host', 'test-host',
@@ -85,19 +85,17 @@ def test_create_parser_all_args():
     assert args.ssl is False
     assert args.dotenv_path == 'custom.env'
 
-def test_create_parser_boolean_args():
-    """Test that boolean arguments are parsed correctly with different formats."""
-    parser = create_parser()
-    
-    # Test various true values
-    for true_val in ['true', 'yes', '1', 't', 'y', 'True', 'YES']:
-        args = parser.parse_args(['--client-type', 'ephemeral', '--ssl', true_val])
-        assert args.ssl is True, f"Failed for value: {true_val}"
-    
-    # Test various false values
-    for false_val in ['false', 'no', '0', 'f', 'n', 'False', 'NO']:
-        args = parser.parse_args(['--client-type', 'ephemeral', '--ssl', false_val])
-        assert args.ssl is False, f"Failed for value: {false_val}"
+@pytest.mark.parametrize("val", ['true', 'yes', '1', 't', 'y', 'True', 'YES'])
+def test_ssl_true(parser, val):
+    """Test that truthy boolean argument formats parse as True."""
+    args = parser.parse_args(['--client-type', 'ephemeral', '--ssl', val])
+    assert args.ssl is True
+
+@pytest.mark.parametrize("val", ['false', 'no', '0', 'f', 'n', 'False', 'NO'])
+def test_ssl_false(parser, val):
+    """Test that falsy boolean argument formats parse as False."""
+    args = parser.parse_args(['--client-type', 'ephemeral', '--ssl', val])
+    assert args.ssl is False
 
 @patch.dict(os.environ, {
     'CHROMA_CLIENT_TYPE': 'http',
@@ -107,6 +105,7 @@ def test_create_parser_boolean_args():
 })
 def test_env_vars_override_defaults():
     """Test that environment variables override default values."""
+    # Build a fresh parser: defaults are read from the environment at construction time
     parser = create_parser()
     args = parser.parse_args([])  # No command line args
     
@@ -116,13 +115,14 @@ def test_env_vars_override_defaults():
     assert args.port == '9090'
     assert args.ssl is False
 
-def test_cmd_args_override_env_vars(mock_env_vars):
+def test_cmd_args_override_env_vars(monkeypatch):
     """Test that command line arguments override environment variables."""
     # Set environment variables
-    os.environ['CHROMA_CLIENT_TYPE'] = 'http'
-    os.environ['CHROMA_HOST'] = 'env-host'
-    os.environ['CHROMA_SSL'] = 'false'
+    monkeypatch.setenv('CHROMA_CLIENT_TYPE', 'http')
+    monkeypatch.setenv('CHROMA_HOST', 'env-host')
+    monkeypatch.setenv('CHROMA_SSL', 'false')
     
+    # Build a fresh parser so it picks up the variables set above
     parser = create_parser()
     # Override with command line args
     args = parser.parse_args([
@@ -138,90 +138,42 @@ def test_cmd_args_override_env_vars(mock_env_vars):
     # But other env vars should still be used
     assert args.host == 'env-host'
 
-@patch('chroma_mcp.server._chroma_client', None)  # Reset the global client
-@patch('chromadb.HttpClient')
-def test_http_client_creation(mock_http_client, mock_env_vars):
-    """Test HTTP client creation with various arguments."""
-    mock_instance = MagicMock()
-    mock_http_client.return_value = mock_instance
-    
-    # Set up command line args
-    sys.argv = ['chroma-mcp', 
-                '--client-type', 'http',
-                '--host', 'test-host',
-                '--port', '8080',
-                '--ssl', 'false']
-    
-    client = get_chroma_client()
-    
-    # Check that HttpClient was called with correct args
-    mock_http_client.assert_called_once()
-    call_kwargs = mock_http_client.call_args.kwargs
-    assert call_kwargs['host'] == 'test-host'
-    assert call_kwargs['port'] == '8080'
-    assert call_kwargs['ssl'] is False
-
-@patch('chroma_mcp.server._chroma_client', None)  # Reset the global client
-@patch('chromadb.HttpClient')
-def test_cloud_client_creation(mock_http_client, mock_env_vars):
-    """Test cloud client creation with various arguments."""
-    mock_instance = MagicMock()
-    mock_http_client.return_value = mock_instance
-    
-    # Set up command line args
-    sys.argv = ['chroma-mcp', 
-                '--client-type', 'cloud',
-                '--tenant', 'test-tenant',
-                '--database', 'test-db',
-                '--api-key', 'test-api-key']
-    
-    client = get_chroma_client()
-    
-    # Check that HttpClient was called with correct args
-    mock_http_client.assert_called_once()
-    call_kwargs = mock_http_client.call_args.kwargs
-    assert call_kwargs['host'] == 'api.trychroma.com'
-    assert call_kwargs['ssl'] is True  # Always true for cloud
-    assert call_kwargs['tenant'] == 'test-tenant'
-    assert call_kwargs['database'] == 'test-db'
-    assert call_kwargs['headers'] == {'x-chroma-token': 'test-api-key'}
-
-@patch('chroma_mcp.server._chroma_client', None)  # Reset the global client
-@patch('chromadb.PersistentClient')
-def test_persistent_client_creation(mock_persistent_client, mock_env_vars):
-    """Test persistent client creation."""
-    mock_instance = MagicMock()
-    mock_persistent_client.return_value = mock_instance
-    
-    # Set up command line args
-    sys.argv = ['chroma-mcp', 
-                '--client-type', 'persistent',
-                '--data-dir', '/test/data/dir']
-    
-    client = get_chroma_client()
-    
-    # Check that PersistentClient was called with correct args
-    mock_persistent_client.assert_called_once_with(path='/test/data/dir')
-
-@patch('chroma_mcp.server._chroma_client', None)  # Reset the global client
-@patch('chromadb.EphemeralClient')
-def test_ephemeral_client_creation(mock_ephemeral_client, mock_env_vars):
-    """Test ephemeral client creation."""
-    mock_instance = MagicMock()
-    mock_ephemeral_client.return_value = mock_instance
-    
+@pytest.mark.xdist_group(name="argv_mutators")
+@pytest.mark.parametrize("client_type, patch_target, argv_extra, expected_kwargs, exact", [
+    ('http', 'HttpClient',
+     ['--host', 'test-host', '--port', '8080', '--ssl', 'false'],
+     {'host': 'test-host', 'port': '8080', 'ssl': False}, False),
+    ('cloud', 'HttpClient',
+     ['--tenant', 'test-tenant', '--database', 'test-db', '--api-key', 'test-api-key'],
+     {'host': 'api.trychroma.com', 'ssl': True,  # Always true for cloud
+      'tenant': 'test-tenant', 'database': 'test-db',
+      'headers': {'x-chroma-token': 'test-api-key'}}, False),
+    ('persistent', 'PersistentClient',
+     ['--data-dir', '/test/data/dir'],
+     {'path': '/test/data/dir'}, True),
+    ('ephemeral', 'EphemeralClient', [], {}, False),
+])
+def test_client_creation(client_type, patch_target, argv_extra, expected_kwargs, exact, monkeypatch):
+    """Test that each client type builds the matching chromadb client with the right arguments."""
+    mock_client = Mock()
+    monkeypatch.setattr('chroma_mcp.server._chroma_client', None)  # Reset the global client
+    monkeypatch.setattr('chromadb.' + patch_target, mock_client)
+
     # Set up command line args
-    sys.argv = ['chroma-mcp', '--client-type', 'ephemeral']
-    
-    client = get_chroma_client()
-    
-    # Check that EphemeralClient was called
-    mock_ephemeral_client.assert_called_once()
+    monkeypatch.setattr(sys, "argv", ['chroma-mcp', '--client-type', client_type] + argv_extra)
+
+    get_chroma_client()
 
-def test_client_type_validation():
+    # Check that the client constructor was called with the expected args
+    mock_client.assert_called_once()
+    call_kwargs = mock_client.call_args.kwargs
+    if exact:
+        assert call_kwargs == expected_kwargs
+    else:
+        assert {k: call_kwargs[k] for k in expected_kwargs} == expected_kwargs
+
+def test_client_type_validation(parser):
     """Test validation of client type argument."""
-    parser = create_parser()
-    
     # Valid client types
     for valid_type in ['http', 'cloud', 'persistent', 'ephemeral']:
         args = parser.parse_args(['--client-type', valid_type])
@@ -231,13 +183,17 @@ def test_client_type_validation():
     with pytest.raises(SystemExit):
         parser.parse_args(['--client-type', 'invalid'])
 
-def test_required_args_for_http_client():
+@pytest.mark.xdist_group(name="argv_mutators")
+def test_required_args_for_http_client(monkeypatch):
     """Test that required arguments are enforced for HTTP client."""
+    # Reuse the shared parser, skip the .chroma_env probe and start from no client
+    monkeypatch.setattr('chroma_mcp.server.create_parser', _cached_parser)
+    monkeypatch.setattr('chroma_mcp.server.load_dotenv', lambda *args, **kwargs: None)
+    monkeypatch.setattr('chroma_mcp.server._chroma_client', None)
+
     with patch('argparse.ArgumentParser.error') as mock_error:
-        from chroma_mcp.server import main
-        
         # Set up command line args without required host
-        sys.argv = ['chroma-mcp', '--client-type', 'http']
+        monkeypatch.setattr(sys, "argv", ['chroma-mcp', '--client-type', 'http'])
         
         try:
             main()
@@ -249,13 +205,17 @@ def test_required_args_for_http_client():
             "Host must be provided via --host flag or CHROMA_HOST environment variable when using HTTP client"
         )
 
-def test_required_args_for_cloud_client():
+@pytest.mark.xdist_group(name="argv_mutators")
+def test_required_args_for_cloud_client(monkeypatch):
     """Test that required arguments are enforced for cloud client."""
+    # Reuse the shared parser, skip the .chroma_env probe and start from no client
+    monkeypatch.setattr('chroma_mcp.server.create_parser', _cached_parser)
+    monkeypatch.setattr('chroma_mcp.server.load_dotenv', lambda *args, **kwargs: None)
+    monkeypatch.setattr('chroma_mcp.server._chroma_client', None)
+
     with patch('argparse.ArgumentParser.error') as mock_error:
-        from chroma_mcp.server import main
-        
         # Set up command line args without required tenant/database/api-key
-        sys.argv = ['chroma-mcp', '--client-type', 'cloud']
+        monkeypatch.setattr(sys, "argv", ['chroma-mcp', '--client-type', 'cloud'])
         
         try:
             main()
@@ -269,8 +229,16 @@ def test_required_args_for_cloud_client():
 
 # --- Tests for chroma_update_documents ---
 
-@pytest.mark.asyncio
-async def test_update_documents_success():
+@contextlib.contextmanager
+def temp_collection(client, name):
+    """Create a collection for the duration of the block and drop it afterwards."""
+    collection = client.create_collection(name)
+    try:
+        yield collection
+    finally:
+        client.delete_collection(name)
+
+async def test_update_documents_success(chroma_client):
     """Test successful document update."""
     collection_name = "test_update_collection_success"
     doc_ids = ["doc1", "doc2"]
@@ -279,17 +247,15 @@ async def test_update_documents_success():
     updated_docs = ["Updated doc 1", initial_docs[1]] # Update only first doc content
     updated_metadatas = [initial_metadatas[0], {"source": "updated"}] # Update only second doc metadata
 
-    try:
-        # 1. Create collection
-        await mcp.call_tool("chroma_create_collection", {"collection_name": collection_name})
-
+    # 1. Create collection
+    with temp_collection(chroma_client, collection_name):
         # 2. Add initial documents
-        await mcp.call_tool("chroma_add_documents", {
-            "collection_name": collection_name,
-            "documents": initial_docs,
-            "metadatas": initial_metadatas,
-            "ids": doc_ids
-        })
+        await _add_docs(
+            collection_name=collection_name,
+            documents=initial_docs,
+            metadatas=initial_metadatas,
+            ids=doc_ids
+        )
 
         # 3. Update documents (pass both documents and metadatas)
         update_result = await mcp.call_tool("chroma_update_documents", {
@@ -322,22 +288,16 @@ async def test_update_documents_success():
         # Check updated metadata
         assert get_result.get("metadatas") == updated_metadatas
 
-    finally:
-        # Clean up
-        await mcp.call_tool("chroma_delete_collection", {"collection_name": collection_name})
-
-@pytest.mark.asyncio
-async def test_update_documents_invalid_args():
+async def test_update_documents_invalid_args(chroma_client):
     """Test update documents with invalid arguments."""
     collection_name = "test_update_collection_invalid"
 
-    try:
-        await mcp.call_tool("chroma_create_collection", {"collection_name": collection_name})
-        await mcp.call_tool("chroma_add_documents", {
-            "collection_name": collection_name,
-            "documents": ["Test doc"],
-            "ids": ["doc1"]
-        })
+    with temp_collection(chroma_client, collection_name):
+        await _add_docs(
+            collection_name=collection_name,
+            documents=["Test doc"],
+            ids=["doc1"]
+        )
 
         # Test with empty IDs list - Expect ToolError wrapping ValueError
         with pytest.raises(ToolError, match="The 'ids' list cannot be empty."):
@@ -358,11 +318,6 @@ async def test_update_documents_invalid_args():
                 # No embeddings, metadatas, or documents
             })
 
-    finally:
-        # Clean up
-        await mcp.call_tool("chroma_delete_collection", {"collection_name": collection_name})
-
-@pytest.mark.asyncio
 async def test_update_documents_collection_not_found():
     """Test updating documents in a non-existent collection."""
     # Expect ToolError wrapping the Exception from the function
@@ -373,17 +328,15 @@ async def test_update_documents_collection_not_found():
             "documents": ["New content"]
         })
 
-@pytest.mark.asyncio
-async def test_update_documents_id_not_found():
+async def test_update_documents_id_not_found(chroma_client):
     """Test updating a document with an ID that does not exist. Expect no exception."""
     collection_name = "test_update_id_not_found"
-    try:
-        await mcp.call_tool("chroma_create_collection", {"collection_name": collection_name})
-        await mcp.call_tool("chroma_add_documents", {
-            "collection_name": collection_name,
-            "documents": ["Test doc"],
-            "ids": ["existing_id"]
-        })
+    with temp_collection(chroma_client, collection_name):
+        await _add_docs(
+            collection_name=collection_name,
+            documents=["Test doc"],
+            ids=["existing_id"]
+        )
 
         # Attempt to update a non-existent ID - should not raise Exception
         update_result = await mcp.call_tool("chroma_update_documents", {
@@ -395,137 +348,75 @@ async def test_update_documents_id_not_found():
         assert len(update_result) == 1
         assert "Successfully processed update request" in update_result[0].text
 
-        # Optionally, verify that the existing document was not changed
-        get_result_raw = await mcp.call_tool("chroma_get_documents", {
-            "collection_name": collection_name,
-            "ids": ["existing_id"],
-            "include": ["documents"]
-        })
-        # Corrected assertion: Parse JSON and check structure/content
-        assert len(get_result_raw) == 1
-        get_result = json.loads(get_result_raw[0].text)
-        assert isinstance(get_result, dict)
-        assert "documents" in get_result
-        assert isinstance(get_result["documents"], list)
+        # Verify that the existing document was not changed, using the client directly
+        collection = chroma_client.get_collection(collection_name)
+        get_result = collection.get(ids=["existing_id"], include=["documents"])
         assert get_result["documents"] == ["Test doc"]
 
-    finally:
-        # Clean up
-        await mcp.call_tool("chroma_delete_collection", {"collection_name": collection_name})
-
 # --- Tests for chroma_delete_documents ---
 
-@pytest_asyncio.fixture
-async def setup_delete_test_collection():
-    """Fixture to set up a collection with documents for deletion tests."""
-    collection_name = "test_delete_docs_collection"
-    client = get_chroma_client()
-
-    # Ensure clean state
-    try:
-        client.delete_collection(collection_name)
-    except Exception:
-        pass
-
-    # Create collection and add documents using the client directly
-    collection = client.get_or_create_collection(collection_name)
+@pytest.fixture(scope="session")
+def template_docs(chroma_client):
+    """Session-wide template collection holding the canonical deletion-test documents."""
+    collection = chroma_client.create_collection("tpl_delete_docs")
     collection.add(
         documents=["doc1 text", "doc2 text", "another doc", "doc4 special"],
         metadatas=[{"type": "a", "val": 1}, {"type": "b", "val": 2}, {"type": "a", "val": 3}, {"type": "c", "val": 4}],
         ids=["id1", "id2", "id3", "id4"]
     )
 
-    yield collection_name
+    yield collection
 
-    # Teardown: Delete the collection after the test
-    try:
-        client.delete_collection(collection_name)
-    except Exception as e:
-        print(f"Error during teardown deleting collection {collection_name}: {e}")
+    chroma_client.delete_collection("tpl_delete_docs")
 
+@pytest_asyncio.fixture
+async def setup_delete_test_collection(template_docs, chroma_client):
+    """Fixture to set up a collection with documents for deletion tests."""
+    collection_name = f"test_delete_docs_{uuid.uuid4().hex}"
 
-@pytest.mark.asyncio
-async def test_delete_documents_by_ids(setup_delete_test_collection):
-    """Test deleting documents by providing a list of IDs."""
-    collection_name = setup_delete_test_collection
-    ids_to_delete = ["id1", "id3"]
+    # Clone the template rows (including embeddings, so nothing is re-embedded)
+    rows = template_docs.get(include=["documents", "metadatas", "embeddings"])
+    collection = chroma_client.create_collection(collection_name)
+    collection.add(
+        ids=rows["ids"],
+        documents=rows["documents"],
+        metadatas=rows["metadatas"],
+        embeddings=rows["embeddings"]
+    )
 
-    delete_result = await mcp.call_tool("chroma_delete_documents", {
-        "collection_name": collection_name,
-        "ids": ids_to_delete
-    })
-    # Check result type and content (assuming tool returns string in a list)
-    assert isinstance(delete_result, list)
-    assert len(delete_result) >= 1
-    assert hasattr(delete_result[0], 'text')
-    assert f"Successfully processed delete request for collection '{collection_name}'" in delete_result[0].text
+    yield collection_name
 
-    # Verify deletion using the client directly
-    client = get_chroma_client()
-    collection = client.get_collection(collection_name)
-    remaining_docs = collection.get(include=["metadatas"])
-    assert "id1" not in remaining_docs["ids"]
-    assert "id3" not in remaining_docs["ids"]
-    assert "id2" in remaining_docs["ids"]
-    assert "id4" in remaining_docs["ids"]
-    assert len(remaining_docs["ids"]) == 2
-
-@pytest.mark.asyncio
-async def test_delete_documents_by_where(setup_delete_test_collection):
-    """Test deleting documents using a 'where' filter."""
-    collection_name = setup_delete_test_collection
-    where_filter = {"type": "a"}
+    # Teardown: Delete the collection after the test
+    chroma_client.delete_collection(collection_name)
 
-    delete_result = await mcp.call_tool("chroma_delete_documents", {
-        "collection_name": collection_name,
-        "where": where_filter
-    })
-    assert isinstance(delete_result, list)
-    assert len(delete_result) >= 1
-    assert hasattr(delete_result[0], 'text')
-    assert f"Successfully processed delete request for collection '{collection_name}'" in delete_result[0].text
 
-    # Verify deletion
-    client = get_chroma_client()
-    collection = client.get_collection(collection_name)
-    remaining_docs = collection.get(include=["metadatas"])
-    assert "id1" not in remaining_docs["ids"]
-    assert "id3" not in remaining_docs["ids"]
-    assert "id2" in remaining_docs["ids"]
-    assert "id4" in remaining_docs["ids"]
-    assert len(remaining_docs["ids"]) == 2
-    for meta in remaining_docs["metadatas"]:
-        assert meta["type"] != "a"
-
-@pytest.mark.asyncio
-async def test_delete_documents_by_where_document(setup_delete_test_collection):
-    """Test deleting documents using a 'where_document' filter."""
+def _assert_delete_ok(result, collection_name):
+    """Assert that a chroma_delete_documents call reported success for the collection."""
+    assert isinstance(result, list) and result
+    assert result[0].text.startswith(
+        f"Successfully processed delete request for collection '{collection_name}'"
+    )
+
+@pytest.mark.parametrize("kwargs, expected_remaining", [
+    ({"ids": ["id1", "id3"]}, {"id2", "id4"}),
+    ({"where": {"type": "a"}}, {"id2", "id4"}),
+    ({"where_document": {"$contains": "special"}}, {"id1", "id2", "id3"}),
+], ids=["by_ids", "by_where", "by_where_document"])
+async def test_delete_documents(setup_delete_test_collection, kwargs, expected_remaining, chroma_client):
+    """Test deleting documents by IDs, a 'where' filter or a 'where_document' filter."""
     collection_name = setup_delete_test_collection
-    where_doc_filter = {"$contains": "special"}
 
     delete_result = await mcp.call_tool("chroma_delete_documents", {
         "collection_name": collection_name,
-        "where_document": where_doc_filter
+        **kwargs
     })
-    assert isinstance(delete_result, list)
-    assert len(delete_result) >= 1
-    assert hasattr(delete_result[0], 'text')
-    assert f"Successfully processed delete request for collection '{collection_name}'" in delete_result[0].text
+    _assert_delete_ok(delete_result, collection_name)
+
+    # Verify deletion using the client directly
+    collection = chroma_client.get_collection(collection_name)
+    remaining_docs = collection.get()
+    assert set(remaining_docs["ids"]) == expected_remaining
 
-    # Verify deletion
-    client = get_chroma_client()
-    collection = client.get_collection(collection_name)
-    remaining_docs = collection.get(include=["documents"])
-    assert "id4" not in remaining_docs["ids"]
-    assert "id1" in remaining_docs["ids"]
-    assert "id2" in remaining_docs["ids"]
-    assert "id3" in remaining_docs["ids"]
-    assert len(remaining_docs["ids"]) == 3
-    for doc in remaining_docs["documents"]:
-        assert "special" not in doc
-
-
-@pytest.mark.asyncio
 async def test_delete_documents_no_criteria_error(setup_delete_test_collection):
     """Test error when no deletion criteria are provided."""
     collection_name = setup_delete_test_collection
@@ -535,7 +426,6 @@ async def test_delete_documents_no_criteria_error(setup_delete_test_collection):
             "collection_name": collection_name
         })
 
-@pytest.mark.asyncio
 async def test_delete_documents_both_ids_and_filter_error(setup_delete_test_collection):
     """Test error when both 'ids' and a filter are provided."""
     collection_name = setup_delete_test_collection
@@ -554,7 +444,6 @@ async def test_delete_documents_both_ids_and_filter_error(setup_delete_test_coll
             "where_document": {"$contains": "text"}
         })
 
-@pytest.mark.asyncio
 async def test_delete_documents_nonexistent_collection():
     """Test error when trying to delete from a non-existent collection."""
     collection_name = "nonexistent_collection_for_delete"
@@ -565,8 +454,7 @@ async def test_delete_documents_nonexistent_collection():
             "ids": ["id_does_not_matter"]
         })
 
-@pytest.mark.asyncio
-async def test_delete_documents_nonexistent_ids(setup_delete_test_collection):
+async def test_delete_documents_nonexistent_ids(setup_delete_test_collection, chroma_client):
     """Test deleting non-existent IDs does not raise an error."""
     collection_name = setup_delete_test_collection
     ids_to_delete = ["nonexistent_id1", "nonexistent_id2"]
@@ -575,13 +463,9 @@ async def test_delete_documents_nonexistent_ids(setup_delete_test_collection):
         "collection_name": collection_name,
         "ids": ids_to_delete
     })
-    assert isinstance(delete_result, list)
-    assert len(delete_result) >= 1
-    assert hasattr(delete_result[0], 'text')
-    assert f"Successfully processed delete request for collection '{collection_name}'" in delete_result[0].text
+    _assert_delete_ok(delete_result, collection_name)
 
     # Verify no documents were actually deleted
-    client = get_chroma_client()
-    collection = client.get_collection(collection_name)
+    collection = chroma_client.get_collection(collection_name)
     count_after = collection.count()
     assert count_after == 4
\ No newline at end of file